@@ -124,6 +124,27 @@ class AttributeInput():
 
         return _X_i
 
+    def get_attribute_completeness(self, U_i: Any) -> float:
+        """Returns input completeness of a single antecedent.
+
+        Args:
+            U_i: Antecedent that the completeness should be computed for.
+
+        Returns:
+            completeness: Sum of the uncertainty of the input for `U_i` if it
+            is an uncertain distribution, 1.0 if it is certain and 0.0 if there
+            is no input for `U_i`.
+        """
+        try:
+            X_i = self[U_i]
+        except KeyError:
+            return 0.0
+
+        if isinstance(X_i, dict):
+            return sum(X_i.values())
+
+        return 1.0
+
     def get_completeness(self, A: List[Any]) -> float:
         """Returns input completeness given set of antecedents.
 
@@ -139,16 +160,13 @@ class AttributeInput():
         Returns:
             completeness: Measures how complete (if there is 1.0 *sum* of
             uncertainty) the input is, 1.0 being totally complete and 0.0 being
-            totally incomplete.
+            totally incomplete. If `A` is empty, there is no input to be
+            complete, so 0.0 is returned.
         """
-        sum_completeness = 0.0
-        for A_i in A:
-            try:
-                if isinstance(self[A_i], dict):
-                    sum_completeness += sum(self[A_i].values())
-                else:
-                    sum_completeness += 1.0
-            except KeyError:
-                sum_completeness += 0.0
+        if len(A) == 0:
+            return 0.0
+
+        sum_completeness = sum(self.get_attribute_completeness(A_i)
+                               for A_i in A)
 
         return sum_completeness / len(A)
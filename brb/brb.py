@@ -27,7 +27,7 @@ approach.
     >>> model.run(X)
     [0.15517241379310348, 0.8448275862068964]
 """
-from typing import List, Any
+from typing import List, Any, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -41,6 +41,11 @@ class RuleBaseModel():
     It contains the basic, standard information that will be used to manage the
     information and apply the operations.
 
+    The inference is computed over arrays aligned to `.rules`. The rules'
+    attribute weights, which are fixed once a rule is defined, are stacked
+    into matrices that are kept until `.rules` changes. Rule weights and
+    belief degrees are read from the rules on every run.
+
     Attributes:
         U: Antecendent attributes' names.
         D: Consequent referential values.
@@ -49,8 +54,11 @@ class RuleBaseModel():
     """
     def __init__(self, U: List[str], D: List[Any], F=None):
         # no repeated elements for U
-        assert len(U) == len(set(U))
+        self._U_set = frozenset(U)
+        assert len(U) == len(self._U_set)
         self.U = U
+        # position of each antecedent attribute in `U`
+        self._U_idx = {U_i: i for i, U_i in enumerate(U)}
         # TODO: add antecedents types
 
         self.D = D
@@ -58,6 +66,10 @@ class RuleBaseModel():
 
         self.rules = list()
 
+        # `.rules` and their attribute weights stacked into matrices, see
+        # `_stack_rules`
+        self._stacked = None
+
     def add_rule(self, new_rule: Rule):
         """Adds a new rule to the model.
 
@@ -65,7 +77,7 @@ class RuleBaseModel():
         to `.rules`.
         """
         # all reference values must be related to an attribute
-        assert set(new_rule.A_values.keys()).issubset(set(self.U))
+        assert self._U_set.issuperset(new_rule.A_values.keys())
 
         # TODO: handle NaN values
 
@@ -94,8 +106,8 @@ class RuleBaseModel():
         antecedents_df = rules_df[self.U]
         consequents_df = rules_df[self.D]
 
-        A_ks = np.matrix(antecedents_df.values)
-        betas = np.matrix(consequents_df.values)
+        A_ks = antecedents_df.to_numpy()
+        betas = consequents_df.to_numpy()
 
         if thetas is not None:
             thetas = rules_df[thetas].values
@@ -103,7 +115,7 @@ class RuleBaseModel():
         deltas = None
         # only valid if there are 1:1 weights to attributes
         if delta_cols is not None and len(delta_cols) == len(self.U):
-            deltas = np.matrix(rules_df[delta_cols].values)
+            deltas = rules_df[delta_cols].to_numpy()
 
         self.add_rules_from_matrix(
             A_ks=A_ks,
@@ -114,9 +126,9 @@ class RuleBaseModel():
 
     def add_rules_from_matrix(
             self,
-            A_ks: np.matrix,
-            betas: np.matrix,
-            deltas: np.matrix = None,
+            A_ks: Union[np.ndarray, np.matrix],
+            betas: Union[np.ndarray, np.matrix],
+            deltas: Union[np.ndarray, np.matrix] = None,
             thetas: np.array = None
         ):
         """Adds several rules through the input matrices.
@@ -148,6 +160,8 @@ class RuleBaseModel():
         if deltas is None:
             # all antecedents have the same weight
             deltas = A_ks.shape[0] * [None, ]
+        else:
+            deltas = np.asarray(deltas)
 
         # there must be a weight for every antecedent for every rule
         assert len(deltas) == A_ks.shape[0]
@@ -160,18 +174,25 @@ class RuleBaseModel():
         # there must be a weight for every rule
         assert len(thetas) == A_ks.shape[0]
 
+        # plain arrays, so that each row is already in the rule shape
+        A_ks = np.asarray(A_ks)
+        betas = np.asarray(betas)
+
         # convert nan values to 0
         betas = np.nan_to_num(betas)
 
-        for A_k, beta_k, delta, theta in zip(A_ks, betas, deltas, thetas):
-            # converst to dict and drops nan values
-            A_k = np.asarray(A_k)[0]
+        # missing referential values are found for all rules at once
+        A_ks_isna = pd.isna(A_ks)
 
-            A_values = {U_i: A_k_value for U_i, A_k_value
-                        in zip(self.U, A_k) if not pd.isna(A_k_value)}
+        for A_k, A_k_isna, rule_beta, delta, theta in zip(A_ks, A_ks_isna,
+                                                         betas, deltas, thetas):
+            # converst to dict and drops nan values
+            A_values = {U_i: A_k_value for U_i, A_k_value, isna
+                        in zip(self.U, A_k, A_k_isna) if not isna}
 
-            # transforms referential value to rule shape
-            rule_beta = np.asarray(beta_k)[0]
+            if delta is not None:
+                delta = {U_i: delta_i for U_i, delta_i, isna
+                         in zip(self.U, delta, A_k_isna) if not isna}
 
             self.add_rule(Rule(A_values=A_values, beta=rule_beta, delta=delta,
                                theta=theta))
@@ -182,6 +203,145 @@ class RuleBaseModel():
 
     # TODO: add interface for "tunable" parameters
 
+    def _stack_rules(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Stacks the rules' attribute weights into matrices aligned to `U`.
+
+        The matrices are stacked again only if `.rules` changed since the
+        last call.
+
+        Returns:
+            antecedents_mask: Boolean matrix, in which the (k, i) element
+            tells if the i-th attribute is an antecedent of the k-th rule.
+            geometric_delta_matrix: Attribute weights of the rules normalized
+            for the geometric matching degree.
+            arithmetic_delta_matrix: Attribute weights of the rules normalized
+            for the arithmetic matching degree.
+        """
+        stacked = self._stacked
+        if stacked is not None:
+            stacked_rules, *matrices = stacked
+
+            if len(stacked_rules) == len(self.rules) and all(
+                    stacked_rule is rule for stacked_rule, rule
+                    in zip(stacked_rules, self.rules)):
+                return tuple(matrices)
+
+        shape = (len(self.rules), len(self.U))
+        antecedents_mask = np.zeros(shape, dtype=bool)
+        # attributes that are not part of a rule keep null weight, so that
+        # they do not contribute to its matching degree
+        geometric_delta_matrix = np.zeros(shape)
+        arithmetic_delta_matrix = np.zeros(shape)
+        for k, rule in enumerate(self.rules):
+            geometric_delta = rule.get_normalized_delta('geometric')
+            arithmetic_delta = rule.get_normalized_delta('arithmetic')
+
+            for U_i in rule.A_values.keys():
+                i = self._U_idx[U_i]
+                antecedents_mask[k, i] = True
+                geometric_delta_matrix[k, i] = geometric_delta[U_i]
+                arithmetic_delta_matrix[k, i] = arithmetic_delta[U_i]
+
+        matrices = (antecedents_mask, geometric_delta_matrix,
+                    arithmetic_delta_matrix)
+        # assigned at once, so that concurrent calls always see consistent
+        # matrices
+        self._stacked = (list(self.rules), *matrices)
+
+        return matrices
+
+    def get_matching_degrees(self, X: AttributeInput) -> np.ndarray:
+        """Calculates the matching degrees of all the rules based on input `X`.
+
+        Equivalent to `Rule.get_matching_degree` for every rule in `.rules`,
+        but the weighted means are computed for all the rules at once over
+        the matrix of antecedents' matching degrees. Rules with a custom
+        matching degree function are still computed individually.
+
+        Returns:
+            matching_degrees: Array in which the k-th element is the matching
+            degree of the k-th rule.
+        """
+        _, geometric_delta_matrix, arithmetic_delta_matrix = \
+            self._stack_rules()
+
+        return self._get_matching_degrees(X, geometric_delta_matrix,
+                                          arithmetic_delta_matrix)
+
+    def _get_matching_degrees(
+            self,
+            X: AttributeInput,
+            geometric_delta_matrix: np.ndarray,
+            arithmetic_delta_matrix: np.ndarray
+        ) -> np.ndarray:
+        """Implements `get_matching_degrees` over already stacked rules.
+
+        Args:
+            X: Attribute's data to be fed to the rules.
+            geometric_delta_matrix: See `_stack_rules`.
+            arithmetic_delta_matrix: See `_stack_rules`.
+        """
+        # the input is prepared once for all the rules
+        X_prep = {U_i: X[U_i] for U_i in X.attr_input.keys()}
+
+        geometric = np.zeros(len(self.rules), dtype=bool)
+        arithmetic = np.zeros(len(self.rules), dtype=bool)
+
+        # alphas[k, i] = \alpha_{k,i} = matching degree of the i-th antecedent
+        # of the k-th rule. Antecedents not in the rule are neutral (see
+        # `_stack_rules`)
+        alphas = np.ones((len(self.rules), len(self.U)))
+        # antecedents' matching degrees of the rules with custom matching
+        # degree functions, by rule index
+        custom_alphas = dict()
+        for k, rule in enumerate(self.rules):
+            geometric[k] = rule.matching_degree == 'geometric'
+            arithmetic[k] = rule.matching_degree == 'arithmetic'
+
+            alphas_i = rule.match_antecedents(X, X_prep)
+
+            for U_i, alpha_i in alphas_i.items():
+                alphas[k, self._U_idx[U_i]] = alpha_i
+
+            if not (geometric[k] or arithmetic[k]):
+                custom_alphas[k] = alphas_i
+
+        # a null match on a weighted antecedent nullifies the geometric mean
+        # (see `Rule.match_antecedents`)
+        geometric_delta_mask = geometric_delta_matrix != 0
+        active = ~np.any(
+            geometric[:, np.newaxis] & geometric_delta_mask & (alphas == 0),
+            axis=1
+        )
+
+        # each row is weighted according to its rule's matching degree method
+        # into a single (R, A) matrix, local to the call. The geometric mean is
+        # computed in the log domain, as
+        # \prod_i \alpha_i^{\delta_i} = \exp(\sum_i \delta_i \log \alpha_i),
+        # so that both methods reduce to a sum. Null weights are skipped to
+        # keep \alpha^0 = 1 for \alpha = 0
+        weighted_alphas = np.zeros_like(geometric_delta_matrix)
+
+        log_mask = (geometric & active)[:, np.newaxis] & geometric_delta_mask
+        # null matches only remain in inactive rows or under null weights, so
+        # the logarithm is always finite
+        np.log(alphas, out=weighted_alphas, where=log_mask)
+        np.multiply(weighted_alphas, geometric_delta_matrix,
+                    out=weighted_alphas, where=log_mask)
+        np.multiply(alphas, arithmetic_delta_matrix,
+                    out=weighted_alphas, where=arithmetic[:, np.newaxis])
+
+        weighted_sums = weighted_alphas.sum(axis=1)
+        matching_degrees = np.where(geometric, np.exp(weighted_sums),
+                                    weighted_sums)
+        matching_degrees[~active] = 0.0
+
+        for k, alphas_i in custom_alphas.items():
+            rule = self.rules[k]
+            matching_degrees[k] = rule.matching_degree(rule.delta, alphas_i)
+
+        return matching_degrees
+
     def run(self, X: AttributeInput):
         """Infer the output based on the RIMER approach.
 
@@ -198,68 +358,87 @@ class RuleBaseModel():
             X: Attribute's data to be fed to the rules.
         """
         # input for all valid antecedents must be provided
-        for U_i in X.attr_input.keys():
-            assert U_i in self.U
+        assert self._U_set.issuperset(X.attr_input.keys())
 
         # 2. matching degree
         # alphas[k] = \alpha_k = matching degree of k-th rule
-        alphas = [rule.get_matching_degree(X) for rule in self.rules]
+        antecedents_mask, geometric_delta_matrix, arithmetic_delta_matrix = \
+            self._stack_rules()
+        alphas = self._get_matching_degrees(X, geometric_delta_matrix,
+                                            arithmetic_delta_matrix)
+
+        # rule weights and belief degrees are read from the rules, so that
+        # changes to them after the rules were added are taken into account
+        theta_vec = np.empty(len(self.rules))
+        beta_matrix = np.empty((len(self.rules), len(self.D)))
+        for k, rule in enumerate(self.rules):
+            theta_vec[k] = rule.theta
+            beta_matrix[k] = rule.beta
 
         # 3. activation weight
         # implementation based on eq. (7) of "Belief rule-base inference
         # methodology using the evidential reasoning Approach-RIMER", by
         # _Yang et al._
+        theta_alphas = theta_vec * alphas
 
         # total_theta_alpha is the sum on the denominator of said equation
-        total_theta_alpha = sum([rule.theta*alpha_k for rule, alpha_k
-                                 in zip(self.rules, alphas)])
+        total_theta_alpha = theta_alphas.sum()
         total_theta_alpha = total_theta_alpha if total_theta_alpha != 0 else 1
 
         # activation_weights[k] = w_k = activation weight of the k-th rule
-        activation_weights = [rule.theta * alpha_k / total_theta_alpha
-                              for rule, alpha_k in zip(self.rules, alphas)]
+        activation_weights = theta_alphas / total_theta_alpha
 
         # 4. degrees of belief
-        # use normalized belief degrees to compensate for incompleteness
-        belief_degrees = [rule.get_belief_degrees_complete(X) for rule
-                          in self.rules]
+        # use normalized belief degrees to compensate for incompleteness (see
+        # `Rule.get_belief_degrees_complete`). The input completeness of each
+        # antecedent is computed once and averaged over each rule's antecedents
+        # (see `AttributeInput.get_completeness`)
+        attr_completeness = np.array([X.get_attribute_completeness(U_i)
+                                      for U_i in self.U])
+        n_antecedents = antecedents_mask.sum(axis=1)
+        # rules without antecedents have null completeness, as in
+        # `AttributeInput.get_completeness`
+        rules_completeness = np.divide(
+            antecedents_mask @ attr_completeness,
+            n_antecedents,
+            out=np.zeros(len(self.rules)),
+            where=n_antecedents > 0
+        )
+
+        # belief_degrees[k, j] = \beta_{j,k} = belief degree of the j-th
+        # consequent in the k-th rule
+        belief_degrees = beta_matrix * rules_completeness[:, np.newaxis]
 
         # 5. analytical ER algorithm
 
         # sum of all belief degrees over the rules
-        total_belief_degrees = [sum(beta_k) for beta_k in belief_degrees]
+        total_belief_degrees = belief_degrees.sum(axis=1)
 
-        # left_prods is the productory that appears both in the left-side
-        # of the numerator of eq. (4) and in \mu. Note that this depends on j
-        left_prods = list()
-        # map is a transposition of belief_degrees
-        for rules_beta_j in map(list, zip(*belief_degrees)):
-            left_prods.append(np.prod(
-                [weight_k * rules_beta_jk + 1 - weight_k * total_belief_degrees_k  # pylint: disable=line-too-long
-                 for weight_k, rules_beta_jk, total_belief_degrees_k
-                 in zip(activation_weights, rules_beta_j, total_belief_degrees)]
-            ))
         # the productory that appears in the right side of the numerator of eq.
         # (4) and in \mu
-        right_prod = np.prod(
-            [1 - weight_k * total_belief_degrees_k
-             for weight_k, total_belief_degrees_k
-             in zip(activation_weights, total_belief_degrees)]
+        right_factors = 1 - activation_weights * total_belief_degrees
+        right_prod = np.prod(right_factors)
+
+        # left_prods is the productory that appears both in the left-side
+        # of the numerator of eq. (4) and in \mu. Note that this depends on j
+        left_prods = np.prod(
+            activation_weights[:, np.newaxis] * belief_degrees
+            + right_factors[:, np.newaxis],
+            axis=0
         )
-        mu = 1 / (sum(left_prods) - (len(self.D) - 1) * right_prod)
+        mu = 1 / (np.sum(left_prods) - (len(self.D) - 1) * right_prod)
 
         # eq. (4)
-        belief_degrees = [mu * (left_prod - right_prod) / (1 - mu * \
-                          np.prod([1 - weight_k for weight_k
-                                   in activation_weights]))
-                          for left_prod in left_prods]
-        # TODO: `brb.py:307: RuntimeWarning: invalid value encountered in
-        # double_scalars` while running test.py
+        belief_degrees = mu * (left_prods - right_prod) \
+            / (1 - mu * np.prod(1 - activation_weights))
+        # TODO: `RuntimeWarning: invalid value encountered in divide` while
+        # running test.py
 
         # handles the case where there is 0 certainty, i.e., completely 0 input
         if all(np.isnan(belief_degrees)):
-            belief_degrees = [mu * (left_prod - right_prod) for left_prod
-                              in left_prods]
+            belief_degrees = mu * (left_prods - right_prod)
+
+        belief_degrees = list(belief_degrees)
 
         # TODO: add utility calculation
 
@@ -281,6 +460,8 @@ def csv2BRB(
         consequents_prefix: str,
         deltas_prefix: str = None,
         thetas: str = None,
+        sep: str = ',',
+        decimal: str = '.',
     ) -> RuleBaseModel:
     """Converts csv table to a belief rule base (RuleBaseModel).
 
@@ -305,12 +486,16 @@ def csv2BRB(
         attributes for every rule.
         thetas: Column name of the rules weights. If `None` (default), will
         assign equal weight (1.0) to all rules.
+        sep: Field delimiter of the csv file.
+        decimal: Decimal separator of the numbers in the csv file. Parsed by
+        pandas, so that tables exported with `,` as decimal separator (usually
+        together with `sep=';'`) need no further conversion.
 
     Returns:
         model: Belief Rule Base containing all the rules defined in the csv
         file.
     """
-    df_rules = pd.read_csv(csv_filepath)
+    df_rules = pd.read_csv(csv_filepath, sep=sep, decimal=decimal)
 
     cols = df_rules.columns
 
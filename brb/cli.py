@@ -81,7 +81,7 @@ def _main(rules, antecedent_prefix, consequent_prefix, deltas_prefix):
     # Display rules and its activations with the results
     print('\nActivated Rules:')
 
-    matching_degrees = [rule.get_matching_degree(X) for rule in model.rules]
+    matching_degrees = model.get_matching_degrees(X)
 
     for rule, matching_degree in zip(model.rules, matching_degrees):
         if matching_degree > 0:
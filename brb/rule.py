@@ -1,6 +1,8 @@
 """Models a belief rule and associated operations.
 """
-from typing import List, Dict, Any, Union, Callable
+from math import prod
+from types import MappingProxyType
+from typing import List, Dict, Any, Union, Callable, Mapping
 from warnings import warn
 
 import numpy as np
@@ -16,12 +18,16 @@ class Rule():
     the consequents. We assume that it is defined as a pure AND rule, that is,
     the only logical relation between the input attributes is the AND function.
 
+    The referential values and the attribute weights are read-only, as they
+    are prepared for matching only once, when the rule is defined. To change
+    them, define a new rule.
+
     Attributes:
         A_values: A^k. Dictionary that matches reference values for each
-        antecedent attribute that activates the rule.
+        antecedent attribute that activates the rule. Read-only.
         beta: \bar{\beta}. Expected belief degrees of consequents if rule is
         delta: \delta_k. Relative weights of antecedent attributes. If not
-        provided, 1 will be set for all attributes.
+        provided, 1 will be set for all attributes. Read-only.
         theta: \theta_k. Rule weight.
         matching_degree: \phi. Defines how to calculate the matching degree for
         the rule. If `Callable`, must be a function that takes `delta`,
@@ -38,25 +44,57 @@ class Rule():
             theta: float = 1,
             matching_degree: Union[str, Callable] = 'arithmetic'
         ):
-        self.A_values = A_values
+        self._A_values = dict(A_values)
+        self._A_keys = frozenset(A_values.keys())
+        # referential values in the data types handled by the model, prepared
+        # once instead of on every match
+        self._A_values_prep = {
+            U_i: AttributeInput.prep_referential_value(A_i)
+            for U_i, A_i in A_values.items()
+        }
 
         if delta is None:
-            self.delta = {attr: 1 for attr in A_values.keys()}
+            self._delta = {attr: 1 for attr in A_values.keys()}
         else:
             # there must exist a weight for all antecedent attributes that
             # activate the rule
             for U_i in A_values.keys():
                 assert U_i in delta.keys()
-            self.delta = delta
+            self._delta = dict(delta)
+
+        # the normalized weights used by the weighted means do not change
+        # after the rule is defined, so they are computed only once. A rule
+        # without antecedents has no weights to normalize
+        max_delta = max(self._delta.values(), default=1)
+        sum_delta = sum(self._delta.values())
+        self._geometric_delta = {U_i: d / max_delta for U_i, d
+                                 in self._delta.items()}
+        self._arithmetic_delta = {U_i: d / sum_delta for U_i, d
+                                  in self._delta.items()}
 
         self.theta = theta
         self.beta = beta
 
         self.matching_degree = matching_degree
 
+    @property
+    def A_values(self) -> Mapping[str, Any]:
+        """Read-only view of the rule's referential values.
+        """
+        return MappingProxyType(self._A_values)
+
+    @property
+    def delta(self) -> Mapping[str, float]:
+        """Read-only view of the rule's attribute weights.
+        """
+        return MappingProxyType(self._delta)
+
     def get_antecedent_matching(self, U_i: Any, X: AttributeInput) -> float:
         """Quantifies matching of an input to the rules' referential value.
 
+        Only the antecedent `U_i` is matched. To match all the antecedents of
+        the rule at once, use `match_antecedents`.
+
         Args:
             U_i: Antecedent to compare.
             X_i: Input to match to the rule.
@@ -69,10 +107,53 @@ class Rule():
         A_i = self.A_values[U_i]
 
         _X_i = X[U_i]
-        _A_i = X.prep_referential_value(A_i)
+        _A_i = self._A_values_prep[U_i]
 
         return self._get_antecedent_matching(_X_i, _A_i, X_i, A_i)
 
+    def match_antecedents(
+            self,
+            X: AttributeInput,
+            X_prep: Dict[str, Any] = None
+        ) -> Dict[str, float]:
+        """Quantifies matching of an input to all the rule's referential values.
+
+        Same as `get_antecedent_matching` for every antecedent of the rule.
+
+        Args:
+            X: Input to match to the rule.
+            X_prep: Values of `X` already prepared (see
+            `AttributeInput.prep_referential_value`), which allows preparing
+            the input only once for several rules. If `None`, the values are
+            prepared from `X`.
+
+        Returns:
+            alphas_i: Maps each antecedent of the rule to the match of `X` to
+            its referential value (see `get_antecedent_matching`). If the
+            matching degree is geometric, the antecedents after a null match
+            on a weighted antecedent are left out, as the rule cannot be
+            activated anyway.
+        """
+        self._assert_input(X)
+
+        if X_prep is None:
+            X_prep = {U_i: X[U_i] for U_i in self.A_values.keys()}
+
+        alphas_i = dict()
+        for U_i, A_i in self.A_values.items():
+            alphas_i[U_i] = self._get_antecedent_matching(
+                X_prep[U_i],
+                self._A_values_prep[U_i],
+                X.attr_input[U_i],
+                A_i
+            )
+
+            if (self.matching_degree == 'geometric' and alphas_i[U_i] == 0
+                    and self._geometric_delta[U_i] > 0):
+                break
+
+        return alphas_i
+
     @staticmethod
     def _get_antecedent_matching(_X_i, _A_i, X_i=None, A_i=None) -> float:
         """Calculates match level between the two inputs.
@@ -212,29 +293,26 @@ class Rule():
         in "Belief rule-base inference methodology using the evidential
         reasoning Approach-RIMER", specifically eq. (6a).
         """
-        self._assert_input(X)
-
-        alphas_i = {
-            U_i: self.get_antecedent_matching(U_i, X)
-            for U_i in self.A_values.keys()
-        }
+        alphas_i = self.match_antecedents(X)
 
         if self.matching_degree == 'geometric':
-            return self._geometric_matching_degree(self.delta, alphas_i)
+            return self._geometric_matching_degree(self._geometric_delta,
+                                                   alphas_i)
         elif self.matching_degree == 'arithmetic':
-            return self._arithmetic_matching_degree(self.delta, alphas_i)
+            return self._arithmetic_matching_degree(self._arithmetic_delta,
+                                                    alphas_i)
         elif callable(self.matching_degree):
             return self.matching_degree(self.delta, alphas_i)
 
     @staticmethod
     def _arithmetic_matching_degree(
-            delta: Dict[str, float],
+            norm_delta: Dict[str, float],
             alphas_i: Dict[str, float]
         ) -> float:
         """Computes arithmetic average of the antecedents' matching degrees.
+
+        `norm_delta` must be normalized by the sum of the attribute weights.
         """
-        norm_delta = {attr: d / sum(delta.values()) for attr, d
-                      in delta.items()}
         weighted_alpha = [
             alpha_i * norm_delta[U_i] for U_i, alpha_i in alphas_i.items()
         ]
@@ -243,18 +321,35 @@ class Rule():
 
     @staticmethod
     def _geometric_matching_degree(
-            delta: Dict[str, float],
+            norm_delta: Dict[str, float],
             alphas_i: Dict[str, float]
         ) -> float:
         """Computes geometric average of the antecedents' matching degrees.
+
+        `norm_delta` must be normalized by the greatest attribute weight.
         """
-        norm_delta = {attr: d / max(delta.values()) for attr, d
-                      in delta.items()}
         weighted_alpha = [
             alpha_i ** norm_delta[U_i] for U_i, alpha_i in alphas_i.items()
         ]
 
-        return np.prod(weighted_alpha)
+        return prod(weighted_alpha)
+
+    def get_normalized_delta(self, matching_degree: str) -> Dict[str, float]:
+        """Returns the attribute weights normalized for a weighted mean.
+
+        Args:
+            matching_degree: Either 'geometric', for weights normalized by the
+            greatest weight, or 'arithmetic', for weights normalized by their
+            sum.
+        """
+        if matching_degree == 'geometric':
+            return self._geometric_delta
+        elif matching_degree == 'arithmetic':
+            return self._arithmetic_delta
+
+        raise ValueError(
+            '`{}` is not a weighted mean'.format(matching_degree)
+        )
 
     def get_belief_degrees_complete(self, X: AttributeInput) -> Dict[Any, Any]:
         """Returns belief degrees transformed based on input completeness
@@ -276,9 +371,7 @@ class Rule():
 
         Guarantees that all the necessary attributes are present in X.
         """
-        rule_attributes = set(self.A_values.keys())
-        input_attributes = set(X.attr_input.keys())
-        assert rule_attributes.intersection(input_attributes) == rule_attributes
+        assert self._A_keys.issubset(X.attr_input.keys())
 
     def __str__(self):
         A_values_str = ["({}:{})".format(U_i, A_i)
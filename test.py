@@ -43,6 +43,30 @@ if __name__ == "__main__":
     })
     assert good_rule.get_matching_degree(X) == 0.0
 
+    # referential values cannot be changed after the rule is defined
+    try:
+        good_rule.A_values['Antecedent'] = 'bad'
+        raise AssertionError('referential values should be read-only')
+    except TypeError:
+        pass
+    try:
+        good_rule.A_values = {'Antecedent': 'bad'}
+        raise AssertionError('referential values should be read-only')
+    except AttributeError:
+        pass
+    assert good_rule.A_values == {'Antecedent': 'good'}
+    try:
+        good_rule.delta['Antecedent'] = 2
+        raise AssertionError('attribute weights should be read-only')
+    except TypeError:
+        pass
+    assert good_rule.delta == {'Antecedent': 1}
+
+    # rule without antecedents
+    empty_rule = Rule(A_values={}, beta=[1, 0])
+    assert empty_rule.get_matching_degree(X) == 0.0
+    assert empty_rule.get_belief_degrees_complete(X) == [0.0, 0.0]
+
     # Matching degrees boundaries
     def obj_function(A, rule):
         X = AttributeInput({
@@ -168,6 +192,32 @@ if __name__ == "__main__":
     })
     belief_degrees = model.run(X)
 
+    # rules changed after being added
+    good_rule.theta = 3.0
+    good_rule.beta = [0.5, 0.5]
+    changed_model = RuleBaseModel(U=U, D=D)
+    changed_model.add_rule(good_rule)
+    changed_model.add_rule(bad_rule)
+    assert np.allclose(model.run(X), changed_model.run(X))
+    assert not np.allclose(model.run(X), belief_degrees)
+
+    # rules without antecedents do not contribute to the inference
+    empty_model = RuleBaseModel(U=['a'], D=['y', 'n'])
+    empty_model.add_rule(Rule(A_values={}, beta=[1, 0]))
+    empty_model.add_rule(Rule(A_values={'a': 'x'}, beta=[0, 1]))
+    single_model = RuleBaseModel(U=['a'], D=['y', 'n'])
+    single_model.add_rule(Rule(A_values={'a': 'x'}, beta=[0, 1]))
+    empty_X = AttributeInput({'a': 'x'})
+    assert np.allclose(empty_model.run(empty_X), [0.0, 1.0])
+    assert np.allclose(empty_model.run(empty_X), single_model.run(empty_X))
+
+    # rules added directly to the list
+    changed_model = RuleBaseModel(U=U, D=D)
+    changed_model.add_rule(good_rule)
+    changed_model.run(X)
+    changed_model.rules.append(bad_rule)
+    assert np.allclose(model.run(X), changed_model.run(X))
+
     # matrix input
     model = RuleBaseModel(
         U=['A_1', 'A_2'],
@@ -196,6 +246,14 @@ if __name__ == "__main__":
     for A_k, rule in zip(A_ks, model.rules):
         assert (A_k == list(rule.A_values.values())).all()
 
+    # matrix input with attribute weights
+    deltas = np.matrix(np.tile([2.0, 1.0], (len(A_ks), 1)))
+    model = RuleBaseModel(U=['A_1', 'A_2'], D=['RS', 'GP'])
+    model.add_rules_from_matrix(A_ks=A_ks, betas=betas, deltas=deltas)
+
+    for rule in model.rules:
+        assert rule.delta == {'A_1': 2.0, 'A_2': 1.0}
+
     # interval string check
     not_intervals = ['', 'word', '12', '1.2', '<3]', '2:']
     for not_interval in not_intervals:
@@ -330,13 +388,109 @@ if __name__ == "__main__":
     for X, expected_matching_degree in input_matches:
         assert model.rules[-1].get_matching_degree(X) == expected_matching_degree
 
-    # csv rule input
+    # batched matching degrees agree with the rules' own
+    for X, _ in input_matches:
+        assert np.allclose(
+            model.get_matching_degrees(X),
+            [rule.get_matching_degree(X) for rule in model.rules]
+        )
+
+    # batched matching degrees for mixed matching degree methods
+    mixed_model = RuleBaseModel(U=['A_1', 'A_2', 'A_3'], D=['Y', 'N'])
+    mixed_rules = [
+        Rule(
+            A_values={'A_1': 'a', 'A_2': 'a', 'A_3': 'a'},
+            beta=[1, 0],
+            delta={'A_1': 2, 'A_2': 0.5, 'A_3': 1},
+            matching_degree='geometric'
+        ),
+        Rule(
+            A_values={'A_1': 'a', 'A_2': 'b'},
+            beta=[0, 1],
+            delta={'A_1': 1, 'A_2': 0},  # null weight
+            matching_degree='geometric'
+        ),
+        Rule(
+            A_values={'A_1': 'b', 'A_3': 'a'},
+            beta=[0.5, 0.5],
+            delta={'A_1': 3, 'A_3': 1},
+            matching_degree='arithmetic'
+        ),
+        Rule(
+            A_values={'A_2': 'a', 'A_3': 'b'},
+            beta=[0.2, 0.8],
+            matching_degree=lambda delta, alphas_i: min(alphas_i.values())
+        ),
+    ]
+    for rule in mixed_rules:
+        mixed_model.add_rule(rule)
+
+    mixed_inputs = [
+        AttributeInput({
+            'A_1': {'a': 0.6, 'b': 0.4},
+            'A_2': {'a': 0.3, 'b': 0.7},
+            'A_3': {'a': 0.9, 'b': 0.1},
+        }),
+        # null match on weighted (first rule) and not weighted (second rule)
+        # antecedents
+        AttributeInput({
+            'A_1': {'a': 0.8, 'b': 0.2},
+            'A_2': {'a': 0.0, 'b': 0.0},
+            'A_3': {'a': 0.5, 'b': 0.5},
+        }),
+    ]
+    for X in mixed_inputs:
+        assert np.allclose(
+            mixed_model.get_matching_degrees(X),
+            [rule.get_matching_degree(X) for rule in mixed_rules]
+        )
+
+    matching_degrees = mixed_model.get_matching_degrees(mixed_inputs[1])
+    assert matching_degrees[0] == 0.0
+    assert np.isclose(matching_degrees[1], 0.8)  # 0^0 = 1
+
+    # geometric matching degree stops at the first null match
+    class CountingRule(Rule):
+        matched = list()
+
+        @staticmethod
+        def _get_antecedent_matching(_X_i, _A_i, X_i=None, A_i=None):
+            CountingRule.matched.append(A_i)
+            return Rule._get_antecedent_matching(_X_i, _A_i, X_i, A_i)
+
+    counting_model = RuleBaseModel(U=['A_1', 'A_2'], D=['Y', 'N'])
+    rule = CountingRule(
+        A_values={'A_1': 'x', 'A_2': 'y'},
+        beta=[1, 0],
+        matching_degree='geometric'
+    )
+    counting_model.add_rule(rule)
+    X = AttributeInput({'A_1': 'z', 'A_2': 'y'})
+
+    assert rule.get_matching_degree(X) == 0.0
+    assert CountingRule.matched == ['x']
+
+    CountingRule.matched.clear()
+    assert counting_model.get_matching_degrees(X)[0] == 0.0
+    assert CountingRule.matched == ['x']
+
     rules_filepath = os.path.join(os.curdir, 'test_rules.csv')
 
     csv_model = csv2BRB(rules_filepath, antecedents_prefix='A_', consequents_prefix='D_')
 
     assert len(csv_model.rules) == len(model.rules)
 
+    # csv rule input with decimal comma
+    rules_filepath = os.path.join(os.curdir, 'test_rules_decimal_comma.csv')
+
+    comma_model = csv2BRB(rules_filepath, antecedents_prefix='A_',
+                          consequents_prefix='D_', sep=';', decimal=',')
+
+    assert len(comma_model.rules) == len(csv_model.rules)
+    for comma_rule, csv_rule in zip(comma_model.rules, csv_model.rules):
+        assert np.asarray(comma_rule.beta).dtype == float
+        assert np.array_equal(comma_rule.beta, csv_rule.beta)
+
     # AttributeInput
     expected_ref_value_conversions = [
         (12, int),
@@ -363,5 +517,8 @@ if __name__ == "__main__":
     assert X.get_completeness(['A_1', 'A_3']) == 1.0
     assert X.get_completeness(['A_2']) == 0.5
     assert X.get_completeness(['A_2', 'A_3']) == 0.75
+    assert X.get_completeness([]) == 0.0
+    assert X.get_attribute_completeness('A_2') == 0.5
+    assert X.get_attribute_completeness('A_4') == 0.0
 
     print('Success!')